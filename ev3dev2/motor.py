@@ -2104,5 +2104,5 @@ class MoveDifferential(MoveTank):
         self.turn_to_angle(speed, angle_target_degrees, brake=True, block=True)
 
         # drive in a straight line to the target coordinates
-        distance_mm = math.sqrt(pow(self.x_pos_mm - x_target_mm, 2) + pow(self.y_pos_mm - y_target_mm, 2))
+        distance_mm = math.hypot(x_target_mm - self.x_pos_mm, y_target_mm - self.y_pos_mm)
         self.on_for_distance(speed, distance_mm, brake, block)
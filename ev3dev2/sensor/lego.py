@@ -27,7 +27,7 @@ import time
 from ev3dev2.button import ButtonBase
 from ev3dev2.sensor import Sensor
 from ev3dev2simulator.connector.sensor_connector import SensorConnector
-from ev3dev2simulator.util.util import get_cm_multiplier, get_inch_multiplier
+from ev3dev2simulator.util.util import CM_MULTIPLIER, INCH_MULTIPLIER
 
 
 class TouchSensor(Sensor):
@@ -537,7 +537,7 @@ class UltrasonicSensor(Sensor):
         self._ensure_mode(self.MODE_US_DIST_CM)
 
         value = self.connector.get_value()
-        return value if value == -1 else value * get_cm_multiplier()
+        return value if value == -1 else value * CM_MULTIPLIER
 
 
     @property
@@ -562,7 +562,7 @@ class UltrasonicSensor(Sensor):
         self.mode = self.MODE_US_SI_CM
 
         value = self.connector.get_value()
-        return value if value == -1 else value * get_cm_multiplier()
+        return value if value == -1 else value * CM_MULTIPLIER
 
 
     @property
@@ -592,7 +592,7 @@ class UltrasonicSensor(Sensor):
         self._ensure_mode(self.MODE_US_DIST_IN)
 
         value = self.connector.get_value()
-        return value if value == -1 else value * get_inch_multiplier()
+        return value if value == -1 else value * INCH_MULTIPLIER
 
 
     @property
@@ -617,7 +617,7 @@ class UltrasonicSensor(Sensor):
         self.mode = self.MODE_US_SI_IN
 
         value = self.connector.get_value()
-        return value if value == -1 else value * get_inch_multiplier()
+        return value if value == -1 else value * INCH_MULTIPLIER
 
 
     @property
@@ -4,6 +4,7 @@ The module config contains all configuration file handling. Most of it is handle
 
 import os
 import sys
+from functools import lru_cache
 from os import listdir
 from os.path import isfile, join
 from pathlib import Path
@@ -26,8 +27,19 @@ class Config:
         world_config_yaml = self._load_world_config(world_config_file_name)
         ConfigChecker.check_world_config(world_config_yaml)
         self.world_config = world_config_yaml.data
+        self.simulation_settings = self._load_simulation_settings()
+        self.simulation_settings_data = self.simulation_settings.data
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_simulation_settings():
+        """
+        Load the simulation settings. These are shipped with the package and do not change
+        while running, so the file is only parsed and validated once.
+        :return: the strictyaml document of the settings, its data is read by the constructor.
+        """
         settings_schema = ConfigChecker.get_settings_schema()
-        self.simulation_settings = self._load_yaml_file('', 'simulation_settings', None, settings_schema)
+        return Config._load_yaml_file('', 'simulation_settings', None, settings_schema)
 
     def _load_world_config(self, file_name: str):
         file_name = 'config_large' if file_name is None else file_name
@@ -113,8 +125,9 @@ def get_world_config():
 
 def get_simulation_settings():
     """
-    Singleton function creating a configuration if it does not exist, and return the instance of the config class.
+    Singleton function creating a configuration if it does not exist, and return the simulation settings of it.
+    Every call returns the same dictionary, so callers should not modify it.
     """
     if not THIS.CONFIG:  # clients might need configuration as well, but do not need world settings
         load_config(None)
-    return THIS.CONFIG.simulation_settings.data
+    return THIS.CONFIG.simulation_settings_data
@@ -8,6 +8,9 @@ from ev3dev2simulator.connection.message.stop_command import StopCommand
 
 FOREVER_MOCK_SECONDS = 45
 
+# Marks arguments of MotorConnector.configure that were not given, since None is a valid value.
+_NOT_SET = object()
+
 
 class MotorConnector:
     """
@@ -70,6 +73,29 @@ class MotorConnector:
 
         self.stop_action = action
 
+    def configure(self, speed=_NOT_SET, distance=_NOT_SET, time=_NOT_SET, stop_action=_NOT_SET,
+                  duty_cycle=_NOT_SET):
+        """
+        Set several parameters of the motor belonging to the given address at once.
+        Parameters which are not given keep their current value.
+        :param speed: in degrees per second.
+        :param distance: in degrees.
+        :param time: in milliseconds.
+        :param stop_action: stop action of the motor, this can be 'hold' or 'coast'.
+        :param duty_cycle: in percentage.
+        """
+
+        if speed is not _NOT_SET:
+            self.speed = speed
+        if distance is not _NOT_SET:
+            self.distance = distance
+        if time is not _NOT_SET:
+            self.time = time
+        if stop_action is not _NOT_SET:
+            self.stop_action = stop_action
+        if duty_cycle is not _NOT_SET:
+            self.duty_cycle = duty_cycle
+
     def run_forever(self) -> float:
         """
         Run the motor indefinitely. This is translated to 45 seconds.
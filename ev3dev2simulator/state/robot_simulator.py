@@ -4,13 +4,11 @@ The robot_simulator module contains the RobotSimulator class which handles how t
 
 
 import math
-import threading
-from queue import Queue, Empty
+from collections import deque
 from typing import Any
-# noinspection PyProtectedMember
-from pymunk import Vec2d
 
 from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.util.util import RAD2DEG
 
 
 class RobotSimulator:
@@ -20,6 +18,19 @@ class RobotSimulator:
     of the simulated robot.
     """
 
+    __slots__ = [
+        'robot',
+        'actuator_queues',
+        'queue_info',
+        'arm_actuators',
+        'motor_actuators_left',
+        'motor_actuators_right',
+        'speaker_actuators',
+        'led_actuators',
+        'should_reset',
+        '_sensor_update_fns',
+    ]
+
     def __init__(self, robot: RobotState):
         self.robot = robot
 
@@ -29,15 +40,20 @@ class RobotSimulator:
         for actuator in self.robot.get_actuators():
             if actuator.ev3type in ['arm', 'motor', 'speaker']:
                 self.queue_info[(actuator.brick, actuator.address)] = actuator
-                self.actuator_queues[(actuator.brick, actuator.address)] = Queue()
+                self.actuator_queues[(actuator.brick, actuator.address)] = deque()
 
-        self.should_reset = False
-        self.locks = {}
+        self.arm_actuators = []
+        self.motor_actuators_left = []
+        self.motor_actuators_right = []
+        self.speaker_actuators = []
+        self._bucket_actuator_queues()
 
-        self.motor_lock = threading.Lock()
+        self.led_actuators = [(address, self.robot.get_actuator(address)) for address in self.robot.led_colors]
 
-        for sensor in self.robot.get_sensors():
-            self.load_sensor(sensor)
+        self.should_reset = False
+
+        # bound once, in the order of robot.sensor_values
+        self._sensor_update_fns = [sensor.get_latest_value for sensor in self.robot.get_sensors()]
 
     def update(self):
         """
@@ -52,42 +68,36 @@ class RobotSimulator:
             self._process_sensors()
             self._sync_physics_sprites()
 
-        self.release_locks()
-
     def put_actuator_job(self, address: (int, str), job: float):
         """
         Add a new move job to the queue for the center motor.
+        Appending to a deque is atomic, so no lock is needed between the socket and simulator threads.
         :param address: Address of the actuator
         :param job: to add.
         """
-        self.actuator_queues[address].put_nowait(job)
+        self.actuator_queues[address].append(job)
 
     def next_actuator_jobs(self) -> any:
         """
         Get the next move jobs for the left and right motor from the queues.
         :return: a floating point numbers representing the job move distances.
         """
-
-        self.motor_lock.acquire()
-
         motor_jobs = []
         for actuator, jobs in self.actuator_queues.items():
             try:
-                job = jobs.get_nowait()
-            except Empty:
+                job = jobs.popleft()
+            except IndexError:
                 job = None
             motor_jobs.append((actuator, job))
 
-        self.motor_lock.release()
         return motor_jobs
 
     def clear_actuator_jobs(self, address: (int, str)):
         """
-        Clears all current jobs of the robot
+        Clears all current jobs of the robot. The queue is cleared in place, so the
+        (address, queue) entries cached by _bucket_actuator_queues stay valid.
         """
-        self.motor_lock.acquire()
-        self.actuator_queues[address] = Queue()
-        self.motor_lock.release()
+        self.actuator_queues[address].clear()
 
     def set_led_color(self, brick_id, led_id, color):
         """
@@ -115,34 +125,14 @@ class RobotSimulator:
         self.robot.reset()
         self.should_reset = False
 
-    def load_sensor(self, sensor):
-        """
-        Load the given sensor adding its default value to this state.
-        Also create a lock for the given sensor.
-        :param sensor: to load.
-        """
-        address = (sensor.brick, sensor.address)
-        self.robot.values[address] = sensor.get_default_value()
-        self.locks[address] = threading.Lock()
-
-    def release_locks(self):
-        """
-        Release all the locked sensor locks. This re-allows for reading
-        the sensor values.
-        """
-        for lock in self.locks.values():
-            if lock.locked():
-                lock.release()
-
     def get_value(self, address: (int, str)) -> Any:
         """
-        Get the value of a sensor by its address. Blocks if the lock of
-        the requested sensor is not available.
+        Get the value of a sensor by its address. The values are replaced as a whole
+        every frame, so no locking is needed to read them.
         :param address: of the sensor to get the value from.
         :return: the value of the sensor.
         """
-        self.locks[address].acquire()
-        return self.robot.values[address]
+        return self.robot.get_value(address)
 
     def determine_port(self, brick_id: int, kwargs: dict, class_name: str):
         """
@@ -177,47 +167,97 @@ class RobotSimulator:
               f'address {kwargs.get("address")} of {self.robot.name}, brick {brick_id}')
         return 'dev_not_connected'
 
-    def _process_actuators(self):
+    def _bucket_actuator_queues(self):
         """
-        Request the movement of the robot motors form the robot state and move
-        the robot accordingly. This is where the different motor jobs are combined to a single movement of the robot.
+        Sort the (address, queue) pairs of the actuators by the way their jobs are processed.
+        The type and side of an actuator do not change after construction, so this only needs to happen once.
+        Arms are stored as (arm, queue) pairs, so their jobs are executed without looking up the address.
         """
-        job_per_actuator = self.next_actuator_jobs()
-        left_ppf = right_ppf = None
-        for (address, job_of_actuator) in job_per_actuator:
+        for address, jobs in self.actuator_queues.items():
             actuator = self.queue_info[address]
             if actuator.ev3type == 'arm':
-                if job_of_actuator is not None:
-                    self.robot.execute_arm_movement(address, job_of_actuator)
+                self.arm_actuators.append((actuator, jobs))
             elif actuator.ev3type == 'motor':
                 if actuator.x_offset < 0:
-                    left_ppf = job_of_actuator
+                    self.motor_actuators_left.append((address, jobs))
                 else:
-                    right_ppf = job_of_actuator
+                    self.motor_actuators_right.append((address, jobs))
             elif actuator.ev3type == 'speaker':
-                self.robot.sounds[address] = job_of_actuator
+                self.speaker_actuators.append((address, jobs))
+
+    def _process_actuators(self):
+        """
+        Request the movement of the robot motors form the robot state and move
+        the robot accordingly. This is where the different motor jobs are combined to a single movement of the robot.
+        """
+        left_ppf = right_ppf = None
+
+        for arm, jobs in self.arm_actuators:
+            try:
+                job = jobs.popleft()
+            except IndexError:
+                continue
+            arm.rotate_arm(job)
+
+        for _, jobs in self.motor_actuators_left:
+            try:
+                left_ppf = jobs.popleft()
+            except IndexError:
+                left_ppf = None
+
+        for _, jobs in self.motor_actuators_right:
+            try:
+                right_ppf = jobs.popleft()
+            except IndexError:
+                right_ppf = None
+
+        sounds = self.robot.sounds
+        for address, jobs in self.speaker_actuators:
+            try:
+                sounds[address] = jobs.popleft()
+            except IndexError:
+                sounds[address] = None
 
         if left_ppf is not None or right_ppf is not None:
             self.robot.execute_movement(left_ppf, right_ppf)
 
     def _process_leds(self):
-        for address, led_color in self.robot.led_colors.items():
-            self.robot.set_led_color(address, led_color)
+        """
+        Update the textures of the leds. Led.set_color_texture only swaps the texture when the color changed.
+        The leds are resolved once at construction, so no actuator is looked up by address here.
+        """
+        led_colors = self.robot.led_colors
+        for address, led in self.led_actuators:
+            led.set_color_texture(led_colors[address])
 
     def _process_sensors(self):
         """
         Process the data of the robot sensors by retrieving the data and putting it
-        in the robot state.
+        in the robot state. A new list is built and swapped in at once, so readers
+        on the socket threads always see a complete snapshot of a single frame.
         """
-        for address, sensor in self.robot.sensors.items():
-            self.robot.values[address] = sensor.get_latest_value()
+        self.robot.sensor_values = [update_fn() for update_fn in self._sensor_update_fns]
 
     def _sync_physics_sprites(self):
-        self.robot.set_last_pos(self.robot.body.position)
-        self.robot.last_angle = math.degrees(self.robot.body.angle)
-        for part in self.robot.parts:
-            rel = Vec2d(part.shape.center_of_gravity)
-            x, y = rel.rotated(self.robot.body.angle) + self.robot.body.position
-            part.sprite.center_x = x
-            part.sprite.center_y = y
-            part.sprite.angle = math.degrees(part.shape.body.angle)
+        """
+        Move the sprites of all robot parts to the position of the physics body. The offsets of
+        all parts are rotated and translated in one pass over the array of offsets.
+        """
+        body = self.robot.body
+        angle = body.angle
+        pos_x, pos_y = body.position
+        degrees = angle * RAD2DEG
+
+        self.robot.set_last_pos(body.position)
+        self.robot.last_angle = degrees
+
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        offsets = self.robot.part_offsets
+        xs = offsets[:, 0] * cos_a - offsets[:, 1] * sin_a + pos_x
+        ys = offsets[:, 0] * sin_a + offsets[:, 1] * cos_a + pos_y
+
+        for sprite, x, y in zip(self.robot.part_sprites, xs.tolist(), ys.tolist()):
+            sprite.center_x = x
+            sprite.center_y = y
+            sprite.angle = degrees
@@ -6,6 +6,7 @@ This class can be seen as a snapshot of the robot at some point in time.
 import math
 
 import arcade as _arcade
+import numpy as np
 import pymunk
 from pymunk.vec2d import Vec2d
 
@@ -22,9 +23,13 @@ from ev3dev2simulator.robotpart.ultrasonic_sensor_top import UltrasonicSensor
 from ev3dev2simulator.robotpart.wheel import Wheel
 from ev3dev2simulator.util.point import Point
 
-from ev3dev2simulator.util.util import calc_differential_steering_angle_x_y
 from ev3dev2simulator.config.config import DEBUG, get_robot_config
 
+_HALF_PI = math.pi * 0.5
+
+# Movement jobs are displacements per frame, the body velocity is per second
+_FRAMES_PER_SECOND = 30.0
+
 
 class RobotState:
     """
@@ -32,13 +37,40 @@ class RobotState:
     of parts defined by BodyParts and ExtraBodyParts.
     """
 
+    __slots__ = [
+        'sprite_list',
+        'side_bar_sprites',
+        'sensors',
+        'actuators',
+        'sensor_indices',
+        'sensor_values',
+        'led_colors',
+        'bricks',
+        'sounds',
+        'config',
+        'body',
+        'scale',
+        'debug_shapes',
+        'wheel_distance',
+        'last_pos',
+        'last_angle',
+        'part_offsets',
+        'part_sprites',
+        'name',
+        'parts',
+        '_wheels',
+        '_color_sensors',
+        '_ultrasonic_bottom_sensors',
+    ]
+
     def __init__(self, config):
         self.sprite_list = _arcade.SpriteList()
         self.side_bar_sprites = _arcade.SpriteList()
 
         self.sensors = {}
         self.actuators = {}
-        self.values = {}
+        self.sensor_indices = {}
+        self.sensor_values = []
         self.led_colors = {}
         self.bricks = []
         self.sounds = {}
@@ -54,8 +86,15 @@ class RobotState:
         self.last_pos = None
         self.last_angle = None
 
+        self.part_offsets = np.zeros((0, 2))
+        self.part_sprites = []
+
         self.name = config['name']
 
+        self._wheels = []
+        self._color_sensors = []
+        self._ultrasonic_bottom_sensors = []
+
         parts = get_robot_config(config['type'])['parts'] if 'type' in config else config['parts']
         self.parts = []
         self.add_parts(parts)
@@ -65,11 +104,7 @@ class RobotState:
         Check if the robot has fallen of the playing field or is stuck in the
         middle of a lake. If so display a message on the screen.
         """
-        wheels = self.get_wheels()
-        for wheel in wheels:
-            if wheel.is_falling():
-                return True
-        return False
+        return any(wheel.is_falling() for wheel in self._wheels)
 
     def add_parts(self, parts):
         """
@@ -115,11 +150,25 @@ class RobotState:
             else:
                 print("Unknown robot part in config")
 
-        self.parts.extend(list(self.get_wheels()))
+        self._wheels = [part for part in self.actuators.values() if part.get_ev3type() == 'motor']
+        self._color_sensors = [part for part in self.sensors.values() if part.get_ev3type() == 'color_sensor']
+        self._ultrasonic_bottom_sensors = [part for part in self.sensors.values()
+                                           if isinstance(part, UltrasonicSensorBottom)]
+
+        self.sensor_indices = {address: index for index, address in enumerate(self.sensors)}
+        self.sensor_values = self._get_default_sensor_values()
+
+        self.parts.extend(self._wheels)
         self.parts.extend(list(self.sensors.values()))
         self.parts.extend(self.bricks)
         self.parts.extend(filter(lambda act: act.get_ev3type() != 'motor', list(self.actuators.values())))
 
+    def _get_default_sensor_values(self):
+        """
+        Get the default values of all sensors, in the order of sensor_values.
+        """
+        return [sensor.get_default_value() for sensor in self.sensors.values()]
+
     def set_last_pos(self, pos):
         """
         Updates the last pos as the given position multiplied by the inverse of the scale.
@@ -145,7 +194,7 @@ class RobotState:
         """
         Resets the robot to its original position, and resets the all measurements.
         """
-        self.values.clear()
+        self.sensor_values = self._get_default_sensor_values()
         orig_pos = self._get_orig_position()
         self.body.position = pymunk.Vec2d(orig_pos.x * self.scale, orig_pos.y * self.scale)
         self.body.angle = math.radians(self._get_orig_orientation())
@@ -191,17 +240,15 @@ class RobotState:
     def setup_visuals(self, scale):
         """
         Creates the sprite list based on all the parts of the robot.
+        Also stores the offsets of the parts to the body as an (N, 2) array, used to sync the sprites to the physics.
         """
         for part in self.parts:
             part.setup_visuals(scale)
             self.sprite_list.append(part.sprite)
 
-    def _move_position(self, distance: Vec2d):
-        """
-        Move all parts of this robot by the given distance vector.
-        :param distance: to move
-        """
-        self.body.velocity = distance * 30.0
+        offsets = [(part.shape.center_of_gravity.x, part.shape.center_of_gravity.y) for part in self.parts]
+        self.part_offsets = np.array(offsets, dtype=np.float64).reshape(-1, 2)
+        self.part_sprites = [part.sprite for part in self.parts]
 
     def _rotate(self, radians: float):
         """
@@ -213,43 +260,30 @@ class RobotState:
     def execute_movement(self, left_ppf: float, right_ppf: float):
         """
         Move the robot and its parts by providing the speed of the left and right motor
-        using the differential steering principle.
+        using the differential steering principle. This is the same calculation as
+        calc_differential_steering_angle_x_y, inlined because it runs every frame.
         :param left_ppf: speed in pixels per second of the left motor.
         :param right_ppf: speed in pixels per second of the right motor.
         """
 
-        distance_left = left_ppf * self.scale if left_ppf is not None else 0
-        distance_right = right_ppf * self.scale if right_ppf is not None else 0
+        distance_left = (left_ppf or 0.0) * self.scale
+        distance_right = (right_ppf or 0.0) * self.scale
 
-        cur_angle = self.body.angle + math.radians(90)
-        diff_angle, diff_x, diff_y = calc_differential_steering_angle_x_y(self.wheel_distance,
-                                                                          distance_left,
-                                                                          distance_right, cur_angle)
-        self._rotate(diff_angle)
-        self._move_position(Vec2d(diff_x, diff_y))
+        center_displacement = (distance_right + distance_left) * 0.5
+        diff_angle = (distance_right - distance_left) / self.wheel_distance
+        new_angle = self.body.angle + _HALF_PI + diff_angle
 
-    def execute_arm_movement(self, address: (int, str), dfp: float):
-        """
-        Move the robot arm by providing the speed of the center motor.
-        :param address: the address of the arm
-        :param dfp: speed in degrees per second of the center motor.
-        """
-        self.actuators[address].rotate_arm(dfp)
-
-    def set_led_color(self, address, color):
-        """
-        Sets the led texture of the led behind address to color
-        """
-        self.actuators[address].set_color_texture(color)
+        self.body.angle += diff_angle
+        velocity = center_displacement * _FRAMES_PER_SECOND
+        self.body.velocity = (velocity * math.cos(new_angle), velocity * math.sin(new_angle))
 
     def set_color_obstacles(self, obstacles: [color_obstacle]):
         """
         Set the obstacles which can be detected by the color sensors of this robot.
         :param obstacles: to be detected.
         """
-        for part in self.sensors.values():
-            if part.get_ev3type() == 'color_sensor':
-                part.set_sensible_obstacles(obstacles)
+        for part in self._color_sensors:
+            part.set_sensible_obstacles(obstacles)
 
     def set_falling_obstacles(self, obstacles):
         """
@@ -257,12 +291,10 @@ class RobotState:
         the entering of a wheel in a 'hole'. Meaning it is stuck or falling.
         :param obstacles: to be detected.
         """
-        for part in self.actuators.values():
-            if part.get_ev3type() == 'motor':
-                part.set_sensible_obstacles(obstacles)
-        for part in self.sensors.values():
-            if isinstance(part, UltrasonicSensorBottom):
-                part.set_sensible_obstacles(obstacles)
+        for part in self._wheels:
+            part.set_sensible_obstacles(obstacles)
+        for part in self._ultrasonic_bottom_sensors:
+            part.set_sensible_obstacles(obstacles)
 
     def get_sensor(self, address):
         """
@@ -286,17 +318,13 @@ class RobotState:
         """
          Gets value of a sensor based on the ev3dev address of the sensor.
          """
-        return self.values[address]
+        return self.sensor_values[self.sensor_indices[address]]
 
     def get_wheels(self):
         """
         Gets all wheels of the robot.
         """
-        wheels = []
-        for part in self.actuators.values():
-            if part.get_ev3type() == 'motor':
-                wheels.append(part)
-        return wheels
+        return self._wheels
 
     def get_sprites(self) -> _arcade.SpriteList:
         """
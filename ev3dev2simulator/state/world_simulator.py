@@ -1,11 +1,10 @@
 """
 The world simulator module contains the WoldSimulator class which simulates the world
 """
-import math
-
 from ev3dev2simulator.state.robot_simulator import RobotSimulator
 from ev3dev2simulator.state.world_state import WorldState
 from ev3dev2simulator.config.config import get_simulation_settings
+from ev3dev2simulator.util.util import RAD2DEG
 
 
 class WorldSimulator:
@@ -51,6 +50,6 @@ class WorldSimulator:
         for obstacle in self.world_state.obstacles:
             obstacle.sprite.center_x = obstacle.body.position.x
             obstacle.sprite.center_y = obstacle.body.position.y
-            obstacle.sprite.angle = math.degrees(obstacle.body.angle)
+            obstacle.sprite.angle = obstacle.body.angle * RAD2DEG
             obstacle.set_new_pos(obstacle.body.position)
             obstacle.new_angle = obstacle.sprite.angle
@@ -100,8 +100,6 @@ class WorldState:
         """
         On screen rescale, rescale all sprites.
         """
-        for robot in self.robots:
-            robot.shapes = []
         for obstacle in self.obstacles:
             obstacle.shape = None
         self.space.remove(self.space.shapes)
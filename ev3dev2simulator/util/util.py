@@ -3,11 +3,38 @@ Module containing various utility function, mostly concerning mathematical 2D ca
 """
 
 import math
+from functools import lru_cache
 from typing import Tuple
 
 import arcade as _arcade
+import numpy as np
 from arcade import PointList
 
+# Multipliers for converting millimeters to other units. Hot paths should multiply by these directly.
+CM_MULTIPLIER = 0.1
+INCH_MULTIPLIER = 0.254
+
+# Multiplier for converting radians to degrees, cheaper than calling math.degrees every frame.
+RAD2DEG = 180.0 / math.pi
+
+
+@lru_cache(maxsize=16)
+def _unit_circle(num_segments: int) -> np.ndarray:
+    """
+    Determine the points on the outline of a circle with radius 1 around the origin.
+    The first two points are repeated at the end to close the outline.
+    The result is cached, so it is made read-only.
+
+    :param num_segments: the number of segments of the circle outline.
+    :return: an array of shape (num_segments + 2, 2) containing the coordinates of the circle points.
+    """
+
+    thetas = np.linspace(0, math.tau, num_segments, endpoint=False)
+    points = np.column_stack((np.cos(thetas), np.sin(thetas)))
+    points = np.concatenate((points, points[:2]))
+    points.setflags(write=False)
+    return points
+
 
 def get_circle_points(center_x: float,
                       center_y: float,
@@ -25,19 +52,8 @@ def get_circle_points(center_x: float,
     :return: a PointList object containing the coordinates of the circle points.
     """
 
-    points = []
-
-    for segment in range(num_segments):
-        theta = 2.0 * 3.1415926 * segment / num_segments
-
-        x = radius * math.cos(theta) + center_x
-        y = radius * math.sin(theta) + center_y
-
-        points.append((x, y))
-
-    points.append(points[0])
-    points.append(points[1])
-    return points
+    points = _unit_circle(num_segments) * radius + (center_x, center_y)
+    return list(map(tuple, points.tolist()))
 
 
 def distance_between_points(x_of_point1: float, y_of_point1: float, x_of_point2: float, y_of_point2: float) -> float:
@@ -81,7 +97,7 @@ def get_cm_multiplier() -> float:
     :return: a floating point value representing the multiplier.
     """
 
-    return 0.1
+    return CM_MULTIPLIER
 
 
 def get_inch_multiplier() -> float:
@@ -90,21 +106,22 @@ def get_inch_multiplier() -> float:
     :return: a floating point value representing the multiplier.
     """
 
-    return 0.254
+    return INCH_MULTIPLIER
+
+
+COLOR_CODES = {
+    (59, 60, 54): 1,  # Black
+    (58, 166, 221): 2,  # Blue
+    (122, 182, 72): 3,  # Green
+    (252, 227, 3): 4,  # Yellow
+    (201, 45, 57): 5,  # Red
+    (235, 235, 235): 6,  # White
+    (255, 255, 255): 6  # White
+}
 
 
 def to_color_code(color: _arcade.Color) -> int:
     """
     Convert rgb tuple to ev3dev color
     """
-    switcher = {
-        (59, 60, 54): 1,  # Black
-        (58, 166, 221): 2,  # Blue
-        (122, 182, 72): 3,  # Green
-        (252, 227, 3): 4,  # Yellow
-        (201, 45, 57): 5,  # Red
-        (235, 235, 235): 6,  # White
-        (255, 255, 255): 6  # White
-    }
-
-    return switcher.get(color, 0)
+    return COLOR_CODES.get(color, 0)
@@ -44,13 +44,14 @@ class Sidebar:
         for brick in bricks:
             self.robot_info[name][(brick.brick, 'speaker')] = {'name': f'{brick.name} sound', 'value': None}
 
-    def add_robot_info(self, name, values, sounds):
+    def add_robot_info(self, name, sensor_indices, sensor_values, sounds):
         """
         Adds the current values of the robot to the sidebar.
+        :param sensor_indices: the index in sensor_values of each sensor by its address.
         """
         robot = self.robot_info[name]
-        for address, value in values.items():
-            robot[address]['value'] = value
+        for address, index in sensor_indices.items():
+            robot[address]['value'] = sensor_values[index]
         for address, sound in sounds.items():
             robot[address]['value'] = sound
 
@@ -144,7 +144,7 @@ class Visualiser(_arcade.Window):
                 self.msg_counter = get_simulation_settings()['exec_settings']['frames_per_second'] * 3
 
         for robot in self.world_state.get_robots():
-            self.sidebar.add_robot_info(robot.name, robot.values, robot.sounds)
+            self.sidebar.add_robot_info(robot.name, robot.sensor_indices, robot.sensor_values, robot.sounds)
 
         self.sidebar.draw()
         if self.msg_counter > 0:
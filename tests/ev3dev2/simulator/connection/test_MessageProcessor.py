@@ -1,4 +1,3 @@
-import threading
 import unittest
 
 from ev3dev2simulator.config.config import get_simulation_settings, load_config
@@ -205,8 +204,8 @@ class MessageProcessorTest(unittest.TestCase):
 
     def test_process_data_request(self):
         robot_sim = create_robot_sim()
-        robot_sim.robot.values[(1, 'ev3-ports:in4')] = 10
-        robot_sim.locks[(1, 'ev3-ports:in4')] = threading.Lock()
+        robot_sim.robot.sensor_indices[(1, 'ev3-ports:in4')] = 0
+        robot_sim.robot.sensor_values = [10]
 
         message_processor = MessageProcessor(1, robot_sim)
         value = message_processor.process_data_request(DataRequest('ev3-ports:in4'))
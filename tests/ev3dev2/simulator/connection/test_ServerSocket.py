@@ -1,5 +1,4 @@
 import json
-import threading
 import unittest
 # based on scaling_multiplier: 0.60
 from typing import Any
@@ -132,8 +131,8 @@ class ServerSocketTest(unittest.TestCase):
         }
 
         server = create_client_socket_handler()
-        server.robot_sim.robot.values[(0, 'ev3-ports:in4')] = 10
-        server.robot_sim.locks[(0, 'ev3-ports:in4')] = threading.Lock()
+        server.robot_sim.robot.sensor_indices[(0, 'ev3-ports:in4')] = 0
+        server.robot_sim.robot.sensor_values = [10]
         data = server.message_handler._process_data_request(d)
         val = self._deserialize(data)
 
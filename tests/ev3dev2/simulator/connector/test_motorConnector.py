@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 
 from ev3dev2._platform.ev3 import OUTPUT_A
 from ev3dev2.motor import Motor
+from ev3dev2simulator.connector.motor_connector import MotorConnector
 
 
 class MotorConnectorTest(unittest.TestCase):
@@ -105,6 +106,23 @@ class MotorConnectorTest(unittest.TestCase):
                              {'type': 'RotateCommand', 'address': 'ev3-ports:outA', 'stop_action': 'coast',
                               'speed': 315, 'distance': 14175.0})
 
+    def test_configure(self):
+        self.clientSocketMock.send_command.return_value = 1
+
+        connector = MotorConnector('ev3-ports:outA', 1050)
+        connector.configure(speed=200, distance=400, stop_action='coast')
+        connector.configure(distance=100)
+        connector.run_to_rel_pos()
+
+        self.assertEqual(connector.time, None)
+        self.assertEqual(connector.duty_cycle, None)
+        self.assertEqual(len(self.clientSocketMock.mock_calls), 1)
+        fn_name, args, kwargs = self.clientSocketMock.mock_calls[0]
+        self.assertEqual(fn_name, 'send_command')
+        self.assertDictEqual(args[0].serialize(),
+                             {'type': 'RotateCommand', 'address': 'ev3-ports:outA', 'stop_action': 'coast',
+                              'speed': 200, 'distance': 100})
+
 
 if __name__ == '__main__':
     unittest.main()
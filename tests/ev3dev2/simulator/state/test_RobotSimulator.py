@@ -1,13 +1,29 @@
+import math
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from pymunk.vec2d import Vec2d
+
+from ev3dev2simulator.robotpart.body_part import BodyPart
 from ev3dev2simulator.state.robot_simulator import RobotSimulator
 from ev3dev2simulator.state.robot_state import RobotState
 from tests.ev3dev2.simulator.state.test_RobotState import TestRobotState
 
 
 class TestRobotSimulator(unittest.TestCase):
-    def test_constructor_and_reset(self):
+    @staticmethod
+    def setup_mock_visuals(state):
+        """
+        Run setup_visuals of the robot with a mock sprite for each part, so no images are loaded.
+        """
+        def set_mock_sprite(part, *_args):
+            part.sprite = MagicMock()
+
+        with patch.object(BodyPart, 'init_sprite_with_list', autospec=True, side_effect=set_mock_sprite):
+            state.setup_visuals(1)
+
+    @patch.object(RobotSimulator, '_sync_physics_sprites')
+    def test_constructor_and_reset(self, _):
         conf = TestRobotState.default_config()
         state = RobotState(conf)
         state.setup_pymunk_shapes(1)
@@ -15,7 +31,6 @@ class TestRobotSimulator(unittest.TestCase):
             arm.rotate_x = 0  # this is set in setup visuals
             arm.rotate_y = 0  # this is set in setup visuals
         sim = RobotSimulator(state)
-        sim._sync_physics_sprites = MagicMock()
         sim.update()
 
         sim._sync_physics_sprites.assert_called_once()
@@ -23,22 +38,124 @@ class TestRobotSimulator(unittest.TestCase):
         self.assertEqual(sim.should_reset, True)
         sim.reset()
         self.assertEqual(sim.should_reset, False)
-        sim.release_locks()
 
-    def test_get_value_and_locks(self):
+    @patch.object(RobotSimulator, '_sync_physics_sprites')
+    def test_get_value(self, _):
         conf = TestRobotState.default_config()
         state = RobotState(conf)
         state.setup_pymunk_shapes(1)
         for arm in state.side_bar_sprites:
             arm.rotate_x = 0  # this is set in setup visuals
             arm.rotate_y = 0  # this is set in setup visuals
+        sensor = state.get_sensor((0, 'ev3-ports:in4'))
+        sensor.get_latest_value = MagicMock(return_value=100)
         sim = RobotSimulator(state)
-        sim._sync_physics_sprites = MagicMock()
         val = sim.get_value((0, 'ev3-ports:in4'))
         self.assertEqual(val, 2550)
-        self.assertEqual(sim.locks[(0, 'ev3-ports:in4')].locked(), True)
+        self.assertEqual(sim.get_value((0, 'ev3-ports:in4')), 2550)  # reading twice does not block
+
+        old_values = state.sensor_values
         sim.update()
-        self.assertEqual(sim.locks[(0, 'ev3-ports:in4')].locked(), False)
+        self.assertIsNot(state.sensor_values, old_values)
+        self.assertEqual(old_values, [2550])
+        self.assertEqual(sim.get_value((0, 'ev3-ports:in4')), 100)
+
+    def test_clear_actuator_jobs_in_place(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        sim = RobotSimulator(state)
+        address = (0, 'ev3-ports:outA')
+        jobs = sim.actuator_queues[address]
+
+        sim.put_actuator_job(address, 1.0)
+        sim.put_actuator_job(address, 2.0)
+        sim.clear_actuator_jobs(address)
+
+        self.assertIs(sim.actuator_queues[address], jobs)
+        self.assertEqual(len(jobs), 0)
+        self.assertIn((address, jobs), sim.motor_actuators_left)
+
+    def test_process_actuators_arm(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        sim = RobotSimulator(state)
+        arm = state.get_actuator((0, 'ev3-ports:outB'))
+        arm.side_bar_arm = MagicMock()
+
+        sim.put_actuator_job((0, 'ev3-ports:outB'), 15)
+        sim._process_actuators()
+        sim._process_actuators()
+        arm.side_bar_arm.rotate.assert_called_once_with(15)
+
+    def test_process_sensors(self):
+        conf = TestRobotState.default_config()
+        for port, x_offset in [('ev3-ports:in1', -20), ('ev3-ports:in2', 20)]:
+            conf['parts'].append({
+                'name': f'color_sensor_{port}',
+                'type': 'color_sensor',
+                'x_offset': x_offset,
+                'y_offset': 81,
+                'brick': 0,
+                'port': port
+            })
+        state = RobotState(conf)
+        state.setup_pymunk_shapes(1)
+        self.setup_mock_visuals(state)
+        sim = RobotSimulator(state)
+
+        left_sensor = state.get_sensor((0, 'ev3-ports:in1'))
+        right_sensor = state.get_sensor((0, 'ev3-ports:in2'))
+        left_sensor.sprite.center_x, left_sensor.sprite.center_y = 50, 100
+        right_sensor.sprite.center_x, right_sensor.sprite.center_y = 150, 100
+        blue_obstacle = MagicMock(color_code=2)
+        blue_obstacle.collided_with.side_effect = lambda x, y: x < 100
+        red_obstacle = MagicMock(color_code=5)
+        red_obstacle.collided_with.return_value = True
+        state.set_color_obstacles([blue_obstacle, red_obstacle])
+
+        sim._process_sensors()
+
+        self.assertEqual(sim.get_value((0, 'ev3-ports:in1')), 2)
+        self.assertEqual(sim.get_value((0, 'ev3-ports:in2')), 5)
+        self.assertEqual(sim.get_value((0, 'ev3-ports:in4')), 2550)
+
+    def test_sync_physics_sprites(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        state.setup_pymunk_shapes(1)
+        self.setup_mock_visuals(state)
+        sim = RobotSimulator(state)
+        self.assertEqual(state.part_offsets.shape, (len(state.parts), 2))
+
+        state.body.angle = 0.5
+        state.body.position = Vec2d(100, 50)
+        sim._sync_physics_sprites()
+
+        for part in state.parts:
+            x, y = Vec2d(part.shape.center_of_gravity).rotated(0.5) + Vec2d(100, 50)
+            self.assertAlmostEqual(part.sprite.center_x, x, 6)
+            self.assertAlmostEqual(part.sprite.center_y, y, 6)
+            self.assertAlmostEqual(part.sprite.angle, math.degrees(0.5), 6)
+        self.assertAlmostEqual(state.last_angle, math.degrees(0.5), 6)
+
+    def test_process_leds_on_change(self):
+        conf = TestRobotState.default_config()
+        state = RobotState(conf)
+        sim = RobotSimulator(state)
+        left_led = state.get_actuator((0, 'led0'))
+        right_led = state.get_actuator((0, 'led1'))
+        left_led.sprite = MagicMock()
+        right_led.sprite = MagicMock()
+
+        sim._process_leds()
+        left_led.sprite.set_texture.assert_not_called()
+        right_led.sprite.set_texture.assert_not_called()
+
+        sim.set_led_color(0, 'led1', 3)
+        sim._process_leds()
+        sim._process_leds()
+        left_led.sprite.set_texture.assert_not_called()
+        right_led.sprite.set_texture.assert_called_once_with(3)
 
     def test_determine_port(self):
         conf = TestRobotState.default_config()
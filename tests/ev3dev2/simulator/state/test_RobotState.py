@@ -6,6 +6,7 @@ from pymunk.vec2d import Vec2d
 
 from ev3dev2simulator.config.config import load_config
 from ev3dev2simulator.state.robot_state import RobotState
+from ev3dev2simulator.util.util import calc_differential_steering_angle_x_y
 
 load_config(None)
 
@@ -112,14 +113,17 @@ class TestRobotState(unittest.TestCase):
         x = state._get_orig_position().x * state.scale
         y = state._get_orig_position().y * state.scale
         state.body.position = Vec2d(5, 5)  # 5 per sec
-        state._move_position(Vec2d(5, 5))
+        state.body.velocity = Vec2d(5 * 30, 5 * 30)
         self.assertEqual(state.body.position, Vec2d(5, 5))
-        self.assertEqual(state.body.velocity, Vec2d(5 * 30, 5 * 30))
+
+        state.sensor_values = [100]
+        self.assertEqual(state.get_value((0, 'ev3-ports:in4')), 100)
 
         state.reset()
 
         self.assertEqual(state.body.position, Vec2d(x, y))
         self.assertEqual(state.body.velocity, Vec2d(0, 0))
+        self.assertEqual(state.get_value((0, 'ev3-ports:in4')), 2550)
 
     def test_execute_movement(self):
         state = RobotState(self.default_config())
@@ -132,6 +136,19 @@ class TestRobotState(unittest.TestCase):
         self.assertAlmostEqual(tuple(state.body.velocity)[1], -5.0 * 30, 3)  # -150 y distance per second
         self.assertEqual(state.body.angle, pi)
 
+        # unequal speeds turn the robot towards the slower wheel
+        orig_angle = state.body.angle
+        diff_angle, diff_x, diff_y = calc_differential_steering_angle_x_y(state.wheel_distance, 2, 4,
+                                                                            orig_angle + pi / 2)
+        state.execute_movement(2, 4)
+        self.assertAlmostEqual(diff_angle, 2 / state.wheel_distance)
+        self.assertAlmostEqual(state.body.angle, orig_angle + diff_angle)
+        self.assertAlmostEqual(tuple(state.body.velocity)[0], diff_x * 30, 3)
+        self.assertAlmostEqual(tuple(state.body.velocity)[1], diff_y * 30, 3)
+
+        state.execute_movement(None, 3)
+        self.assertAlmostEqual(state.body.angle, orig_angle + diff_angle + 3 / state.wheel_distance)
+
     def test_arm_movement(self):
         config = self.default_config().copy()
         config['parts'].append({
@@ -148,7 +165,7 @@ class TestRobotState(unittest.TestCase):
             state = RobotState(self.default_config())
             state.setup_pymunk_shapes(1)
 
-            state.execute_arm_movement((0, 'ev3-ports:outB'), 15)
+            state.get_actuator((0, 'ev3-ports:outB')).rotate_arm(15)
             state.actuators[(0, 'ev3-ports:outB')].side_bar_arm.degrees = 15
 
             self.assertEqual(len(arm_instance.mock_calls), 3)  # first two have to do with a sprite list
@@ -1,19 +1,20 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from ev3dev2simulator.config.config import load_config
+from ev3dev2simulator.state.robot_simulator import RobotSimulator
 from ev3dev2simulator.state.world_simulator import WorldSimulator
 
 load_config(None)
 
 
 class TestWorldSimulator(unittest.TestCase):
-    def test_update(self):
+    @patch.object(RobotSimulator, 'update')
+    def test_update(self, _):
         robot_mock = MagicMock()
         world_state_mock = MagicMock()
         world_state_mock.robots = [robot_mock]
         world_simulator = WorldSimulator(world_state_mock)
-        world_simulator.robot_simulators[0].update = MagicMock()
         world_simulator.update()
         world_simulator.robot_simulators[0].update.assert_called_once_with()
         self.assertFalse(world_simulator.robot_simulators[0].should_reset)
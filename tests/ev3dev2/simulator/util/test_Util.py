@@ -1,7 +1,7 @@
 import unittest
 from math import hypot
 
-from ev3dev2simulator.util.util import get_circle_points, calc_differential_steering_angle_x_y
+from ev3dev2simulator.util.util import get_circle_points, calc_differential_steering_angle_x_y, distance_between_points
 
 
 class UtilTest(unittest.TestCase):
@@ -16,10 +16,22 @@ class UtilTest(unittest.TestCase):
 
         self.assertEqual(len(points), 66)
 
+    def test_get_circle_points_values(self):
+        points = get_circle_points(100, 50, 10, 4)
+
+        expected = [(110, 50), (100, 60), (90, 50), (100, 40), (110, 50), (100, 60)]
+        for (x, y), (expected_x, expected_y) in zip(points, expected):
+            self.assertAlmostEqual(x, expected_x, 6)
+            self.assertAlmostEqual(y, expected_y, 6)
+
     def test_pythagoras(self):
         result = hypot(2, 3)
         self.assertAlmostEqual(result, 3.606, 3)
 
+    def test_distance_between_points(self):
+        result = distance_between_points(1, 1, 3, 4)
+        self.assertAlmostEqual(result, 3.606, 3)
+
     def test_differential_steering_angle_x_y(self):
         diff_angle, diff_x, diff_y \
             = calc_differential_steering_angle_x_y(10, 2, 3, 0.4)